@@ -0,0 +1,32 @@
+"""
+Сборка модуля `_kernels` с заранее скомпилированными ядрами расчёта.
+
+Ядра компилируются из функций `main.py`, поэтому формулы остаются
+в одном месте. Импорт `main` ядра не компилирует: JIT-версии
+собираются только при первом вызове.
+Собранный `process_batch` считает строки пакета последовательно:
+параллельные циклы numba при сборке заранее недоступны.
+Запуск: python build_kernels.py
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from main import (_kernel_run_kcal, _kernel_swim_kcal, _kernel_walk_kcal,
+                  _process_batch)
+
+BASE_DIR: Path = Path(__file__).resolve().parent
+
+cc: CC = CC('_kernels')
+cc.output_dir = str(BASE_DIR)
+
+cc.export('run_kcal', 'f8(f8, f8, f8)')(_kernel_run_kcal)
+cc.export('walk_kcal', 'f8(f8, f8, f8, f8)')(_kernel_walk_kcal)
+cc.export('swim_kcal', 'f8(f8, f8, f8)')(_kernel_swim_kcal)
+cc.export('process_batch',
+          'void(i1[:], f8[:, :], f8[:], f8[:], f8[:])')(_process_batch)
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -6,13 +6,23 @@
 бега, спортивной ходьбы и плавания.
 """
 
-from dataclasses import dataclass
+import sys
+from itertools import starmap
 from typing import Any, Union
 
+import numpy as np
+from numba import njit, prange
+from numba.extending import register_jitable
+
 SWM: str = 'SWM'
 RUN: str = 'RUN'
 WLK: str = 'WLK'
 
+# Числовые коды тренировок для пакетной обработки в numba-ядрах.
+SWM_ID: int = 0
+RUN_ID: int = 1
+WLK_ID: int = 2
+
 # Значения констант - корректная длина списка для каждой тренировки.
 LEN_FOR_SWM: int = 5
 LEN_FOR_RUN: int = 3
@@ -22,23 +32,46 @@ NOT_FOUND: str = 'Неизвестная тренировка.'
 BAD_DATA: str = 'Некорректный пакет данных.'
 
 
-@dataclass
+def format_message(training_type: str,
+                   duration: float,
+                   distance: float,
+                   speed: float,
+                   calories: float) -> str:
+    """Сформировать информационное сообщение о результатах тренировки."""
+    return (f'Тип тренировки: {training_type}; '
+            f'Длительность: {duration:.3f} ч.; '
+            f'Дистанция: {distance:,.3f} км; '
+            f'Ср. скорость: {speed:,.3f} км/ч; '
+            f'Потрачено ккал: {calories:,.3f}.')
+
+
 class InfoMessage:
     """Информационное сообщение о тренировке."""
 
-    training_type: str
-    duration: float
-    distance: float
-    speed: float
-    calories: float
+    # Объект создаётся на каждую тренировку, поэтому обходимся без __dict__
+    # и без сгенерированных dataclass методов.
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
+
+    def __init__(self,
+                 training_type: str,
+                 duration: float,
+                 distance: float,
+                 speed: float,
+                 calories: float) -> None:
+        """Сохраняет результаты тренировки."""
+        self.training_type: str = training_type
+        self.duration: float = duration
+        self.distance: float = distance
+        self.speed: float = speed
+        self.calories: float = calories
 
     def get_message(self):
         """Возвращает информационное сообщение о результатах тренировки."""
-        return (f'Тип тренировки: {self.training_type}; '
-                f'Длительность: {self.duration:.3f} ч.; '
-                f'Дистанция: {self.distance:,.3f} км; '
-                f'Ср. скорость: {self.speed:,.3f} км/ч; '
-                f'Потрачено ккал: {self.calories:,.3f}.')
+        return format_message(self.training_type,
+                              self.duration,
+                              self.distance,
+                              self.speed,
+                              self.calories)
 
 
 class Training:
@@ -48,6 +81,17 @@ class Training:
     LEN_STEP: float = 0.65
     M_IN_KM: int = 1000
     MIN_IN_HOUR: int = 60
+    # Название тренировки для информационного сообщения.
+    TRAINING_TYPE: str = 'Training'
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Задаёт название тренировки по имени подкласса.
+
+        Название, заданное в теле подкласса, не перезаписывается.
+        """
+        super().__init_subclass__(**kwargs)
+        if 'TRAINING_TYPE' not in cls.__dict__:
+            cls.TRAINING_TYPE = cls.__name__
 
     def __init__(self,
                  action: int,
@@ -71,7 +115,7 @@ class Training:
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        self.mean_speed_km_h = self.get_distance() / self.duration
+        self.mean_speed_km_h = self._mean_speed_from(self.get_distance())
 
         return self.mean_speed_km_h
 
@@ -79,13 +123,31 @@ class Training:
         """Получить количество затраченных калорий."""
         raise NotImplementedError
 
+    def _mean_speed_from(self, distance_km: float) -> float:
+        """Средняя скорость по уже рассчитанной дистанции."""
+        return distance_km / self.duration
+
+    def _kcal_from(self, mean_speed_km_h: float) -> float:
+        """Расход калорий по уже рассчитанной средней скорости.
+
+        Подклассы переопределяют метод, чтобы не пересчитывать скорость.
+        По умолчанию расчёт делегируется `get_spent_calories`.
+        """
+        return self.get_spent_calories()
+
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
-        training_info: InfoMessage = InfoMessage(self.__class__.__name__,
-                                                 self.duration,
-                                                 self.get_distance(),
-                                                 self.get_mean_speed(),
-                                                 self.get_spent_calories())
+        distance_km: float = self.get_distance()
+        self.mean_speed_km_h = self._mean_speed_from(distance_km)
+        self.spent_calories = self._kcal_from(self.mean_speed_km_h)
+
+        training_info: InfoMessage = InfoMessage(
+            self.TRAINING_TYPE,
+            self.duration,
+            distance_km,
+            self.mean_speed_km_h,
+            self.spent_calories
+        )
 
         return training_info
 
@@ -98,16 +160,14 @@ class Running(Training):
 
     def get_spent_calories(self) -> float:
         """Расход калорий для бега."""
-        self.spent_calories = (
-            (self.CALORIES_MEAN_SPEED_MULTIPLIER
-             * self.get_mean_speed()
-             + self.CALORIES_MEAN_SPEED_SHIFT)
-            * self.weight / self.M_IN_KM
-            * (self.duration * self.MIN_IN_HOUR)
-        )
+        self.spent_calories = self._kcal_from(self.get_mean_speed())
 
         return self.spent_calories
 
+    def _kcal_from(self, mean_speed_km_h: float) -> float:
+        """Расход калорий для бега по средней скорости."""
+        return _run_kcal(mean_speed_km_h, self.duration, self.weight)
+
 
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
@@ -129,19 +189,17 @@ class SportsWalking(Training):
 
     def get_spent_calories(self) -> float:
         """Расчёт калорий для спортивной ходьбы."""
-        meters_in_sec: float = self.get_mean_speed() * self.M_TO_SEC_CONVERTER
-
-        self.spent_calories = (
-            (
-                self.CALORIES_WEIGHT_FACTOR_1 * self.weight
-                + (meters_in_sec ** 2 / self.height)
-                * self.CALORIES_WEIGHT_FACTOR_2 * self.weight
-            )
-            * self.duration * self.MIN_IN_HOUR
-        )
+        self.spent_calories = self._kcal_from(self.get_mean_speed())
 
         return self.spent_calories
 
+    def _kcal_from(self, mean_speed_km_h: float) -> float:
+        """Расчёт калорий для спортивной ходьбы по средней скорости."""
+        return _walk_kcal(mean_speed_km_h,
+                          self.duration,
+                          self.weight,
+                          self.height)
+
 
 class Swimming(Training):
     """Тренировка: плавание."""
@@ -175,66 +233,425 @@ class Swimming(Training):
 
     def get_spent_calories(self) -> float:
         """Расчёт калорий для плавания."""
-        self.spent_calories = (
-            (
-                self.get_mean_speed()
-                + self.SPEED_SWIM_SHIFT
-            )
-            * self.CALORIES_SPEED_SWIM_MULTIPLIER
-            * self.weight
-            * self.duration
-        )
+        self.spent_calories = self._kcal_from(self.get_mean_speed())
 
         return self.spent_calories
 
+    def _mean_speed_from(self, distance_km: float) -> float:
+        """Скорость плавания считается по бассейну, а не по гребкам."""
+        return self.get_mean_speed()
+
+    def _kcal_from(self, mean_speed_km_h: float) -> float:
+        """Расчёт калорий для плавания по средней скорости."""
+        return _swim_kcal(mean_speed_km_h, self.duration, self.weight)
+
+
+# Константы классов для numba-ядер: внутри njit-функций атрибуты классов
+# недоступны, а глобальные значения подставляются при компиляции.
+# Формулы ядер повторяют методы классов операция в операцию.
+_M_IN_KM: int = Training.M_IN_KM
+_MIN_IN_HOUR: int = Training.MIN_IN_HOUR
+_RUN_LEN_STEP: float = Running.LEN_STEP
+_RUN_SPEED_MULTIPLIER: int = Running.CALORIES_MEAN_SPEED_MULTIPLIER
+_RUN_SPEED_SHIFT: float = Running.CALORIES_MEAN_SPEED_SHIFT
+_WLK_LEN_STEP: float = SportsWalking.LEN_STEP
+_WLK_WEIGHT_FACTOR_1: float = SportsWalking.CALORIES_WEIGHT_FACTOR_1
+_WLK_WEIGHT_FACTOR_2: float = SportsWalking.CALORIES_WEIGHT_FACTOR_2
+_WLK_M_TO_SEC: float = SportsWalking.M_TO_SEC_CONVERTER
+_WLK_CM_IN_METER: int = SportsWalking.CM_IN_METER
+_SWM_LEN_STEP: float = Swimming.LEN_STEP
+_SWM_SPEED_SHIFT: float = Swimming.SPEED_SWIM_SHIFT
+_SWM_SPEED_MULTIPLIER: int = Swimming.CALORIES_SPEED_SWIM_MULTIPLIER
+
+
+@register_jitable
+def _kernel_run_kcal(speed: float, duration: float, weight: float) -> float:
+    """Расход калорий для бега по средней скорости в км/ч."""
+    return ((_RUN_SPEED_MULTIPLIER * speed + _RUN_SPEED_SHIFT)
+            * weight / _M_IN_KM
+            * (duration * _MIN_IN_HOUR))
+
+
+@register_jitable
+def _kernel_walk_kcal(speed: float,
+                      duration: float,
+                      weight: float,
+                      height: float) -> float:
+    """Расход калорий для спортивной ходьбы, рост в метрах."""
+    meters_in_sec = speed * _WLK_M_TO_SEC
+
+    return ((_WLK_WEIGHT_FACTOR_1 * weight
+             + (meters_in_sec * meters_in_sec / height)
+             * _WLK_WEIGHT_FACTOR_2 * weight)
+            * duration * _MIN_IN_HOUR)
+
+
+@register_jitable
+def _kernel_swim_kcal(speed: float, duration: float, weight: float) -> float:
+    """Расход калорий для плавания по средней скорости в км/ч."""
+    return ((speed + _SWM_SPEED_SHIFT)
+            * _SWM_SPEED_MULTIPLIER * weight * duration)
+
+
+@register_jitable
+def _kernel_distance(action: float, len_step: float) -> float:
+    """Дистанция в км, как в `Training.get_distance`."""
+    return action * len_step / _M_IN_KM
+
+
+@register_jitable
+def _kernel_swim_speed(length_pool: float,
+                       count_pool: float,
+                       duration: float) -> float:
+    """Средняя скорость плавания в км/ч по длине бассейна.
+
+    Порядок операций совпадает с `Swimming.get_mean_speed`.
+    """
+    return length_pool * count_pool / _M_IN_KM / duration
+
+
+# Класс тренировки и корректная длина пакета для каждого кода тренировки.
+_DISPATCH: dict[str, tuple[type, int]] = {
+    SWM: (Swimming, LEN_FOR_SWM),
+    RUN: (Running, LEN_FOR_RUN),
+    WLK: (SportsWalking, LEN_FOR_WLK),
+}
+
+_TYPE_IDS: dict[str, int] = {
+    SWM: SWM_ID,
+    RUN: RUN_ID,
+    WLK: WLK_ID,
+}
+
+# Номера показателей пакета, на которые делят формулы расчёта:
+# длительность, рост при ходьбе, длина и количество бассейнов в плавании.
+_POSITIVE_PARAMS: dict[str, tuple[int, ...]] = {
+    SWM: (1, 3, 4),
+    RUN: (1,),
+    WLK: (1, 3),
+}
+
 
 def checking_correct_data(wrk_typ: str, dat_list: list) -> bool:
     """Проверка списка пакетов данных.
 
     Для каждой тренировки список проверяется на длину и присутствие None.
+    В массиве NumPy пропуском считается и NaN; None может храниться
+    только в массиве с dtype=object.
     """
-    correct_list_length = {
-        SWM: LEN_FOR_SWM,
-        RUN: LEN_FOR_RUN,
-        WLK: LEN_FOR_WLK
-    }
-
-    if None in dat_list:
-        return False
+    package_len: int = _DISPATCH[wrk_typ][1]
+
+    if isinstance(dat_list, np.ndarray):
+        if dat_list.shape != (package_len,):
+            return False
+        if dat_list.dtype == object:
+            # NaN - единственное значение, не равное самому себе.
+            return not any(value is None or value != value
+                           for value in dat_list)
+        return not np.isnan(dat_list).any()
+
+    return len(dat_list) == package_len and None not in dat_list
+
+
+def checking_correct_data_batch(workout_types: np.ndarray,
+                                matrix: np.ndarray) -> np.ndarray:
+    """Проверка пакетов данных, уложенных в матрицу.
+
+    Строка матрицы - пакет, дополненный NaN до ширины пакета плавания.
+    Пакет корректен, если код тренировки известен, первые показатели
+    заполнены, а оставшиеся после них ячейки - NaN.
+    Длительность, рост и параметры бассейна должны быть положительными:
+    ядро `process_batch` не может выбросить исключение для одной строки,
+    поэтому деление на ноль отсекается до расчёта.
+    Возвращает булев массив с результатом проверки каждого пакета.
+    """
+    workout_types = np.asarray(workout_types)
+    package_lens = np.zeros(len(workout_types), dtype=np.int64)
+    must_be_positive = np.zeros(matrix.shape, dtype=bool)
+    for workout_tpe, (_, package_len) in _DISPATCH.items():
+        mask = workout_types == workout_tpe
+        package_lens[mask] = package_len
+        must_be_positive[np.ix_(mask, _POSITIVE_PARAMS[workout_tpe])] = True
 
-    if len(dat_list) != correct_list_length[wrk_typ]:
-        return False
+    expected_filled = (np.arange(matrix.shape[1])
+                       < package_lens[:, np.newaxis])
 
-    return True
+    return ((~np.isnan(matrix) == expected_filled).all(axis=1)
+            & ~(must_be_positive & ~(matrix > 0)).any(axis=1)
+            & (package_lens > 0))
 
 
 def read_package(workout_tpe: str,
-                 data_list: list[Union[int, float], ...]) -> Any:
+                 data_list: list[Union[int, float], ...]) -> Training:
     """Прочитать данные полученные от датчиков."""
-    training_classes: dict = {
-        SWM: Swimming,
-        RUN: Running,
-        WLK: SportsWalking
-    }
+    try:
+        training_cls, _ = _DISPATCH[workout_tpe]
+    except KeyError:
+        raise Exception(NOT_FOUND) from None
 
-    if workout_tpe not in training_classes:
+    if not checking_correct_data(workout_tpe, data_list):
+        raise Exception(BAD_DATA)
+
+    return training_cls(*data_list)
+
+
+def _process_batch(type_ids: np.ndarray,
+                   params: np.ndarray,
+                   distances: np.ndarray,
+                   speeds: np.ndarray,
+                   calories: np.ndarray) -> None:
+    """Рассчитать результаты пакета тренировок за один проход.
+
+    Строка `params` - пакет данных, дополненный до ширины пакета плавания.
+    Результаты записываются в переданные массивы `distances`, `speeds`
+    и `calories`; для неизвестного кода тренировки записывается NaN.
+    """
+    for i in prange(type_ids.shape[0]):
+        type_id = type_ids[i]
+        action = params[i, 0]
+        duration = params[i, 1]
+        weight = params[i, 2]
+
+        if type_id == SWM_ID:
+            distances[i] = _kernel_distance(action, _SWM_LEN_STEP)
+            speeds[i] = _kernel_swim_speed(params[i, 3],
+                                           params[i, 4],
+                                           duration)
+            calories[i] = _kernel_swim_kcal(speeds[i], duration, weight)
+        elif type_id == RUN_ID:
+            distances[i] = _kernel_distance(action, _RUN_LEN_STEP)
+            speeds[i] = distances[i] / duration
+            calories[i] = _kernel_run_kcal(speeds[i], duration, weight)
+        elif type_id == WLK_ID:
+            distances[i] = _kernel_distance(action, _WLK_LEN_STEP)
+            speeds[i] = distances[i] / duration
+            calories[i] = _kernel_walk_kcal(speeds[i],
+                                            duration,
+                                            weight,
+                                            params[i, 3] / _WLK_CM_IN_METER)
+        else:
+            distances[i] = np.nan
+            speeds[i] = np.nan
+            calories[i] = np.nan
+
+
+# Ядра, заранее собранные `build_kernels.py`, если модуль `_kernels`
+# доступен, иначе - JIT-версии тех же функций. Собранный `process_batch`
+# считает строки последовательно, JIT-версия - параллельно.
+# JIT-ядра компилируются при первом вызове, а не при импорте модуля,
+# поэтому импорт модуля при сборке `_kernels` их не компилирует.
+try:
+    import _kernels
+except ImportError:
+    _run_kcal = njit(cache=True)(_kernel_run_kcal)
+    _walk_kcal = njit(cache=True)(_kernel_walk_kcal)
+    _swim_kcal = njit(cache=True)(_kernel_swim_kcal)
+    process_batch = njit(parallel=True, cache=True)(_process_batch)
+else:
+    _run_kcal = _kernels.run_kcal
+    _walk_kcal = _kernels.walk_kcal
+    _swim_kcal = _kernels.swim_kcal
+    process_batch = _kernels.process_batch
+
+
+def training_type_ids(workout_types: np.ndarray) -> np.ndarray:
+    """Перевести коды тренировок в числовые коды для `process_batch`.
+
+    Неизвестным кодам соответствует -1.
+    """
+    workout_types = np.asarray(workout_types)
+    type_ids = np.full(len(workout_types), -1, dtype=np.int8)
+    for workout_tpe, type_id in _TYPE_IDS.items():
+        type_ids[workout_types == workout_tpe] = type_id
+
+    return type_ids
+
+
+def _compute_batch(type_ids: np.ndarray,
+                   params: np.ndarray,
+                   ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Запустить `process_batch` и вернуть массивы его результатов."""
+    distances = np.empty(len(type_ids))
+    speeds = np.empty_like(distances)
+    calories = np.empty_like(distances)
+    process_batch(type_ids, params, distances, speeds, calories)
+
+    return distances, speeds, calories
+
+
+def batch_process(workout_types: np.ndarray,
+                  actions: np.ndarray,
+                  durations: np.ndarray,
+                  weights: np.ndarray,
+                  heights: np.ndarray,
+                  length_pools: np.ndarray,
+                  count_pools: np.ndarray,
+                  ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Рассчитать результаты для пакета тренировок.
+
+    Данные передаются столбцами: по одному массиву на каждый показатель
+    датчиков, значения, не используемые видом тренировки, игнорируются.
+    Столбцы собираются в матрицу и рассчитываются ядром `process_batch`.
+    Возвращает массивы дистанций, средних скоростей и калорий.
+    """
+    type_ids = training_type_ids(workout_types)
+    if (type_ids < 0).any():
         raise Exception(NOT_FOUND)
 
-    if not checking_correct_data(workout_tpe, data_list):
+    # Четвёртый показатель - рост при ходьбе и длина бассейна в плавании.
+    fourth_params = np.where(type_ids == WLK_ID, heights, length_pools)
+    params = np.column_stack(
+        (actions, durations, weights, fourth_params, count_pools)
+    ).astype(np.float64, copy=False)
+
+    return _compute_batch(type_ids, params)
+
+
+def info_dtype() -> np.dtype:
+    """Тип записи столбчатого аналога InfoMessage.
+
+    Поля совпадают по названиям с атрибутами `InfoMessage`.
+    Ширина поля `training_type` - по самому длинному названию тренировки.
+    """
+    type_len: int = max(len(training_cls.TRAINING_TYPE)
+                        for training_cls, _ in _DISPATCH.values())
+
+    return np.dtype([
+        ('training_type', f'U{type_len}'),
+        ('duration', np.float64),
+        ('distance', np.float64),
+        ('speed', np.float64),
+        ('calories', np.float64),
+    ])
+
+
+def batch_info(workout_types: np.ndarray,
+               durations: np.ndarray,
+               distances: np.ndarray,
+               speeds: np.ndarray,
+               calories: np.ndarray) -> np.ndarray:
+    """Собрать результаты пакета тренировок в структурированный массив.
+
+    Каждая запись массива содержит те же данные, что и `InfoMessage`,
+    но без создания объекта Python на каждую тренировку.
+    """
+    workout_types = np.asarray(workout_types)
+    info = np.empty(len(workout_types), dtype=info_dtype())
+
+    for workout_tpe, (training_cls, _) in _DISPATCH.items():
+        info['training_type'][workout_types == workout_tpe] = (
+            training_cls.TRAINING_TYPE
+        )
+    info['duration'] = durations
+    info['distance'] = distances
+    info['speed'] = speeds
+    info['calories'] = calories
+
+    return info
+
+
+def _join_messages(info: np.ndarray) -> str:
+    """Сообщения для всех записей `batch_info`, по одному на строку."""
+    if not len(info):
+        return ''
+
+    return '\n'.join(starmap(format_message, info.tolist())) + '\n'
+
+
+def format_batch(info: np.ndarray, encoding: str = 'utf-8') -> bytes:
+    """Сформировать сообщения для всех записей `batch_info`.
+
+    Сообщения разделяются переводом строки и кодируются одним вызовом,
+    результат можно сразу записать в бинарный поток.
+    """
+    return _join_messages(info).encode(encoding)
+
+
+def packages_to_matrix(packages: list[tuple[str, list]]
+                       ) -> tuple[np.ndarray, np.ndarray]:
+    """Уложить список пакетов данных в матрицу для `process_batch`.
+
+    Коды тренировок и длины пакетов проверяются, как в `read_package`,
+    но проверка строже: пропуском считается не только None, но и NaN,
+    поэтому пакет с NaN отклоняется. Кроме того, длительность, рост
+    и параметры бассейна должны быть положительными, как требует
+    `checking_correct_data_batch`. Значения приводятся к float64,
+    так что числовые строки принимаются как числа.
+    Возвращает массив кодов тренировок и матрицу пакетов,
+    дополненных NaN до ширины пакета плавания.
+    """
+    workout_types = np.array([workout_tpe for workout_tpe, _ in packages])
+    matrix = np.full((len(packages), LEN_FOR_SWM), np.nan)
+
+    if not np.isin(workout_types, tuple(_DISPATCH)).all():
+        raise Exception(NOT_FOUND)
+
+    for i, (_, data_list) in enumerate(packages):
+        if len(data_list) > LEN_FOR_SWM:
+            raise Exception(BAD_DATA)
+        # None в списке при записи в массив становится NaN.
+        matrix[i, :len(data_list)] = data_list
+
+    if not checking_correct_data_batch(workout_types, matrix).all():
         raise Exception(BAD_DATA)
 
-    training_cls: Training = training_classes[workout_tpe](*data_list)
+    return workout_types, matrix
+
+
+def packages_to_columns(packages: list[tuple[str, list]]
+                        ) -> tuple[np.ndarray, ...]:
+    """Разложить список пакетов данных по столбцам для `batch_process`.
+
+    Пакеты проверяет `packages_to_matrix`.
+    Отсутствующие у вида тренировки показатели заполняются NaN.
+    """
+    workout_types, matrix = packages_to_matrix(packages)
+
+    # Четвёртый показатель - рост при ходьбе и длина бассейна в плавании.
+    mask_wlk = workout_types == WLK
+    heights = np.where(mask_wlk, matrix[:, 3], np.nan)
+    length_pools = np.where(mask_wlk, np.nan, matrix[:, 3])
+
+    return (workout_types,
+            matrix[:, 0],
+            matrix[:, 1],
+            matrix[:, 2],
+            heights,
+            length_pools,
+            matrix[:, 4])
 
-    return training_cls
 
+def format_one(training_obj: Training) -> str:
+    """Сформировать информационное сообщение для объекта тренировки."""
+    return training_obj.show_training_info().get_message()
+
+
+def main(training_obj: Training) -> None:
+    """Главная функция.
+
+    Ошибки в данных обрабатывает `read_package`, поэтому сюда
+    всегда передаётся объект тренировки.
+    Для вывода многих тренировок сообщения `format_one` стоит собрать
+    и записать одним вызовом, как это делает `run_batch`.
+    """
+    sys.stdout.write(format_one(training_obj) + '\n')
+
+
+def run_batch(packages: list[tuple[str, list]]) -> None:
+    """Обработать список пакетов данных целиком и вывести результаты.
+
+    Пакеты проверяет `packages_to_matrix`, результаты рассчитываются
+    одним проходом `process_batch`, а сообщения выводятся одной записью
+    в стандартный вывод.
+    """
+    workout_types, matrix = packages_to_matrix(packages)
+    distances, speeds, calories = _compute_batch(
+        training_type_ids(workout_types), matrix
+    )
+
+    info = batch_info(workout_types, matrix[:, 1], distances, speeds, calories)
 
-def main(training_obj: Any) -> None:
-    """Главная функция."""
-    if isinstance(training_obj, Training):
-        info: InfoMessage = training_obj.show_training_info()
-        print(info.get_message())
-    else:
-        print(training_obj)
+    sys.stdout.write(_join_messages(info))
 
 
 if __name__ == '__main__':
@@ -244,6 +661,4 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    run_batch(packages)
@@ -451,3 +451,259 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+BATCH_PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+    ('SWM', [1206, 12, 6, 12, 6]),
+]
+
+
+def test_batch_process():
+    assert hasattr(main, 'batch_process'), (
+        'Создайте функцию для пакетной обработки тренировок '
+        '- `batch_process`'
+    )
+    workout_types, *values = main.packages_to_columns(BATCH_PACKAGES)
+    distances, speeds, calories = main.batch_process(workout_types, *values)
+    for i, (workout_type, data) in enumerate(BATCH_PACKAGES):
+        training = main.read_package(workout_type, data)
+        assert distances[i] == pytest.approx(training.get_distance()), (
+            'Дистанция в `batch_process` должна совпадать с `get_distance`'
+        )
+        assert speeds[i] == pytest.approx(training.get_mean_speed()), (
+            'Скорость в `batch_process` должна совпадать с `get_mean_speed`'
+        )
+        assert calories[i] == pytest.approx(
+            training.get_spent_calories()
+        ), (
+            'Калории в `batch_process` должны совпадать '
+            'с `get_spent_calories`'
+        )
+
+
+@pytest.mark.parametrize('packages', [
+    [('BOX', [720, 1, 80])],
+    [('RUN', [15000, 1])],
+    [('WLK', [9000, 1, None, 180])],
+])
+def test_packages_to_columns_bad_data(packages):
+    with pytest.raises(Exception):
+        main.packages_to_columns(packages)
+
+
+@pytest.mark.parametrize('data, expected', [
+    (main.np.array([9000, 1, 75, 180], dtype=object), True),
+    (main.np.array([9000, 1, None, 180], dtype=object), False),
+    (main.np.array([9000, 1, float('nan'), 180], dtype=object), False),
+    (main.np.array([9000, 1, float('nan'), 180]), False),
+    (main.np.array([9000, 1, 75]), False),
+])
+def test_checking_correct_data_array(data, expected):
+    assert main.checking_correct_data('WLK', data) is expected, (
+        '`checking_correct_data` должна находить None и NaN в массивах '
+        'NumPy, не вызывая исключений'
+    )
+
+
+def test_checking_correct_data_batch():
+    nan = float('nan')
+    workout_types = ['SWM', 'RUN', 'WLK', 'RUN', 'WLK', 'BOX']
+    matrix = main.np.array([
+        [720, 1, 80, 25, 40],
+        [15000, 1, 75, nan, nan],
+        [9000, 1, 75, 180, nan],
+        [15000, 1, 75, 180, nan],
+        [9000, 1, nan, 180, nan],
+        [720, 1, 80, nan, nan],
+    ])
+    result = main.checking_correct_data_batch(workout_types, matrix)
+    assert list(result) == [True, True, True, False, False, False], (
+        '`checking_correct_data_batch` должна проверять код тренировки, '
+        'длину пакета и пропуски в нём'
+    )
+
+
+@pytest.mark.parametrize('package', [
+    ('SWM', [720, 0, 80, 25, 40]),
+    ('SWM', [720, 1, 80, 0, 40]),
+    ('SWM', [720, 1, 80, 25, -1]),
+    ('RUN', [100, 0, 75]),
+    ('WLK', [9000, 0, 75, 180]),
+    ('WLK', [9000, 1, 75, 0]),
+])
+def test_run_batch_non_positive_params(package):
+    with pytest.raises(Exception, match=main.BAD_DATA):
+        main.run_batch(BATCH_PACKAGES + [package])
+
+
+def test_batch_info():
+    assert hasattr(main, 'batch_info'), (
+        'Создайте функцию для сборки результатов пакета - `batch_info`'
+    )
+    workout_types, *values = main.packages_to_columns(BATCH_PACKAGES)
+    info = main.batch_info(workout_types,
+                           values[1],
+                           *main.batch_process(workout_types, *values))
+    for record, (workout_type, data) in zip(info, BATCH_PACKAGES):
+        expected = main.read_package(workout_type, data).show_training_info()
+        assert record['training_type'] == expected.training_type, (
+            'Тип тренировки в `batch_info` должен совпадать с `InfoMessage`'
+        )
+        for field in ['duration', 'distance', 'speed', 'calories']:
+            assert record[field] == pytest.approx(getattr(expected, field)), (
+                f'Поле `{field}` в `batch_info` должно совпадать '
+                'с `InfoMessage`'
+            )
+
+
+def test_batch_info_long_training_type(monkeypatch):
+    class NordicWalkingWithPoles(main.SportsWalking):
+        pass
+
+    monkeypatch.setitem(main._DISPATCH, 'WLK',
+                        (NordicWalkingWithPoles, main.LEN_FOR_WLK))
+    info = main.batch_info(['WLK'], [1.0], [5.85], [5.85], [157.5])
+    assert info['training_type'][0] == 'NordicWalkingWithPoles', (
+        '`batch_info` не должна обрезать название тренировки'
+    )
+
+
+def test_process_batch():
+    assert hasattr(main, 'process_batch'), (
+        'Создайте ядро пакетной обработки тренировок - `process_batch`'
+    )
+    workout_types, matrix = main.packages_to_matrix(BATCH_PACKAGES)
+    type_ids = main.training_type_ids(workout_types)
+    distances = main.np.empty(len(type_ids))
+    speeds = main.np.empty(len(type_ids))
+    calories = main.np.empty(len(type_ids))
+    main.process_batch(type_ids, matrix, distances, speeds, calories)
+    expected = main.batch_process(*main.packages_to_columns(BATCH_PACKAGES))
+    for result, expected_column in zip((distances, speeds, calories),
+                                       expected):
+        assert list(result) == pytest.approx(list(expected_column)), (
+            '`process_batch` должна давать те же результаты, '
+            'что и `batch_process`'
+        )
+
+
+def test_format_batch():
+    workout_types, *values = main.packages_to_columns(BATCH_PACKAGES)
+    info = main.batch_info(workout_types,
+                           values[1],
+                           *main.batch_process(workout_types, *values))
+    expected = [
+        main.read_package(*package).show_training_info().get_message()
+        for package in BATCH_PACKAGES
+    ]
+    result = main.format_batch(info)
+    assert isinstance(result, bytes), (
+        '`format_batch` должна возвращать значение типа `bytes`'
+    )
+    assert result.decode('utf-8').splitlines() == expected, (
+        '`format_batch` должна формировать те же сообщения, '
+        'что и `InfoMessage.get_message`'
+    )
+
+
+def test_run_batch(capsys):
+    assert hasattr(main, 'run_batch'), (
+        'Создайте функцию обработки списка пакетов - `run_batch`'
+    )
+    expected = [
+        main.read_package(*package).show_training_info().get_message()
+        for package in BATCH_PACKAGES
+    ]
+    main.run_batch(BATCH_PACKAGES)
+    assert capsys.readouterr().out.splitlines() == expected, (
+        '`run_batch` должна печатать сообщения для всех пакетов'
+    )
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_show_training_info_attributes(input_data):
+    training = main.read_package(*input_data)
+    info = training.show_training_info()
+    assert training.mean_speed_km_h == info.speed, (
+        'Метод `show_training_info` должен сохранять среднюю скорость '
+        'в атрибуте `mean_speed_km_h`'
+    )
+    assert training.spent_calories == info.calories, (
+        'Метод `show_training_info` должен сохранять расход калорий '
+        'в атрибуте `spent_calories`'
+    )
+
+
+@pytest.mark.parametrize('input_data, expected', [
+    (('RUN', [37619, 3.255, 52]), 1391.4225),
+    (('RUN', [2850, 1, 75]), 158.1075),
+])
+def test_batch_matches_objects_exactly(input_data, expected):
+    training = main.read_package(*input_data)
+    assert training.get_spent_calories() == expected, (
+        'Ядра расчёта калорий должны повторять формулы классов '
+        'без изменения порядка операций'
+    )
+    distances, speeds, calories = main.batch_process(
+        *main.packages_to_columns([input_data])
+    )
+    assert (distances[0], speeds[0], calories[0]) == (
+        training.get_distance(),
+        training.get_mean_speed(),
+        training.get_spent_calories(),
+    ), (
+        '`batch_process` должна давать в точности те же значения, '
+        'что и методы классов'
+    )
+
+
+@pytest.mark.parametrize('packages', [
+    [('RUN', [2850, 1, 75])],
+    [('RUN', [37619, 3.255, 52])],
+    BATCH_PACKAGES,
+])
+def test_run_batch_matches_main(packages):
+    with Capturing() as batch_output:
+        main.run_batch(packages)
+    with Capturing() as main_output:
+        for package in packages:
+            main.main(main.read_package(*package))
+    assert batch_output == main_output, (
+        '`run_batch` должна печатать в точности то же, что и `main` '
+        'для каждого пакета'
+    )
+
+
+def test_training_type_from_subclass_body():
+    class Custom(main.Running):
+        TRAINING_TYPE = 'Бег'
+
+    class Derived(Custom):
+        pass
+
+    assert Custom.TRAINING_TYPE == 'Бег', (
+        'Название тренировки, заданное в подклассе, '
+        'не должно перезаписываться'
+    )
+    assert Derived.TRAINING_TYPE == 'Derived', (
+        'Без своего названия подкласс получает имя класса'
+    )
+
+
+@pytest.mark.parametrize('input_data', [
+    ('RUN', [15000, 1]),
+    ('WLK', [9000, 1, None, 180]),
+    ('WLK', main.np.array([9000, 1, float('nan'), 180])),
+])
+def test_read_package_bad_data(input_data):
+    with pytest.raises(Exception, match=main.BAD_DATA):
+        main.read_package(*input_data)